@@ -1,17 +1,34 @@
-from flask import Flask, render_template, request, redirect, url_for, session, flash, jsonify
+from flask import Flask, render_template, request, redirect, url_for, session, flash, jsonify, abort
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
 from werkzeug.security import generate_password_hash, check_password_hash
 from datetime import datetime, timedelta
+from functools import wraps
 import os
+import gzip
+import hashlib
+import json
+import re
+import mimetypes
+import socket
 import smtplib
-from email.mime.text import MimeText
-from email.mime.multipart import MimeMultipart
+from email.mime.text import MIMEText
+from email.mime.multipart import MIMEMultipart
 import threading
 import time
+import click
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'clave-secreta-robotica-2024')
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///tareas.db'
+# Web y worker deben compartir base de datos para usar la cola de trabajos
+app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///tareas.db').replace('postgres://', 'postgresql://', 1)
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
 # Configuración de email
@@ -21,6 +38,21 @@ app.config['MAIL_USE_TLS'] = True
 app.config['MAIL_USERNAME'] = os.environ.get('EMAIL_USER', 'test@gmail.com')
 app.config['MAIL_PASSWORD'] = os.environ.get('EMAIL_PASS', 'password')
 app.config['PROFESOR_EMAIL'] = os.environ.get('PROFESOR_EMAIL', 'profesor@tec.mx')
+app.config['MAIL_TIMEOUT'] = 30  # segundos; sin esto un servidor SMTP colgado bloquea el worker
+
+# Configuración de caché HTTP
+app.config['COMPRESION_MINIMO'] = 1024  # bytes
+app.config['COMPRESION_NIVEL_GZIP'] = 6
+app.config['COMPRESION_NIVEL_BROTLI'] = 5
+app.config['VENDOR_DIR'] = os.path.join(app.root_path, 'static', 'vendor')
+
+# Configuración de trabajos en segundo plano
+app.config['TRABAJOS_MAX_INTENTOS'] = 5
+app.config['TRABAJOS_REINTENTO_BASE'] = 30  # segundos, se duplica en cada intento
+app.config['TRABAJOS_TIMEOUT'] = 15 * 60  # segundos sin latido antes de liberar un trabajo colgado
+app.config['TRABAJOS_LATIDO'] = 30  # segundos entre latidos de un trabajo en ejecución
+app.config['TRABAJOS_DURACION_MAX'] = 30 * 60  # segundos; pasado esto se libera aunque siga mandando latidos
+app.config['TRABAJOS_RETENCION_DIAS'] = 7
 
 db = SQLAlchemy(app)
 
@@ -49,34 +81,120 @@ class TareaUsuario(db.Model):
     completada = db.Column(db.Boolean, default=False)
     fecha_completada = db.Column(db.DateTime, nullable=True)
 
+    __table_args__ = (
+        db.Index('ix_tarea_usuario_usuario_tarea', 'usuario_id', 'tarea_id'),
+    )
+
+class VersionDatos(db.Model):
+    """Contadores por ámbito ('tareas', 'usuarios', 'usuario:<id>') que suben con cada escritura; base de los ETags"""
+    ambito = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+def ambitos_afectados(obj):
+    """Ámbitos de versión que invalida un cambio en este objeto"""
+    if isinstance(obj, Tarea):
+        return {'tareas'}
+    if isinstance(obj, Usuario):
+        return {'usuarios'}
+    if isinstance(obj, TareaUsuario):
+        # Incluir el usuario anterior si la asignación cambió de dueño
+        usuarios = {obj.usuario_id, *db.inspect(obj).attrs.usuario_id.history.deleted}
+        return {f'usuario:{u}' for u in usuarios if u is not None}
+    return set()
+
+def incrementar_version(sesion, ambito):
+    """Subir la versión de un ámbito, creando su fila si no existe (SQLite y Postgres)"""
+    sesion.execute(db.text("""
+        INSERT INTO version_datos (ambito, version) VALUES (:ambito, 1)
+        ON CONFLICT (ambito) DO UPDATE SET version = version_datos.version + 1
+    """), {'ambito': ambito})
+
+@event.listens_for(Session, 'before_flush')
+def incrementar_version_datos(sesion, contexto, instancias):
+    """Invalidar solo los ETags de las páginas que leen lo que cambió"""
+    ambitos = set()
+    for obj in list(sesion.new) + list(sesion.dirty) + list(sesion.deleted):
+        ambitos |= ambitos_afectados(obj)
+    # Orden fijo para que dos transacciones no se bloqueen mutuamente
+    for ambito in sorted(ambitos):
+        incrementar_version(sesion, ambito)
+
+class Trabajo(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    nombre = db.Column(db.String(100), nullable=False, index=True)
+    argumentos = db.Column(db.Text, nullable=True)  # JSON
+    estado = db.Column(db.String(20), nullable=False, default='pendiente')
+    intentos = db.Column(db.Integer, nullable=False, default=0)
+    max_intentos = db.Column(db.Integer, nullable=False)
+    clave_unica = db.Column(db.String(200), unique=True, nullable=True)
+    ejecutar_en = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    fecha_creacion = db.Column(db.DateTime, default=datetime.utcnow)
+    fecha_inicio = db.Column(db.DateTime, nullable=True)
+    latido = db.Column(db.DateTime, nullable=True)
+    fecha_fin = db.Column(db.DateTime, nullable=True)
+    duracion_ms = db.Column(db.Float, nullable=True)
+    worker = db.Column(db.String(100), nullable=True)
+    error = db.Column(db.Text, nullable=True)
+
+    __table_args__ = (
+        db.Index('ix_trabajo_estado_ejecutar_en', 'estado', 'ejecutar_en'),
+    )
+
+# Trabajos en segundo plano
+TRABAJOS = {}
+
+# (nombre del trabajo, expresión cron en UTC: minuto hora día mes día_semana)
+PROGRAMACIONES = [
+    ('verificar_recordatorios', '0 * * * *'),
+    ('limpiar_trabajos', '30 3 * * *'),
+]
+
+def trabajo(nombre):
+    """Registrar una función como trabajo ejecutable por el worker"""
+    def registrar(funcion):
+        TRABAJOS[nombre] = funcion
+        return funcion
+    return registrar
+
+def encolar(nombre, ejecutar_en=None, clave_unica=None, max_intentos=None, **argumentos):
+    """Agregar trabajo a la cola; se guarda con el commit de la sesión actual"""
+    nuevo = Trabajo(
+        nombre=nombre,
+        argumentos=json.dumps(argumentos),
+        ejecutar_en=ejecutar_en or datetime.utcnow(),
+        clave_unica=clave_unica,
+        max_intentos=max_intentos or app.config['TRABAJOS_MAX_INTENTOS']
+    )
+    db.session.add(nuevo)
+    return nuevo
+
 # Funciones de Email
 def enviar_email(destinatario, asunto, cuerpo):
-    """Enviar email de forma asíncrona"""
-    def enviar():
-        try:
-            if app.config['MAIL_USERNAME'] == 'test@gmail.com':
-                print(f"📧 [DEMO] Email a {destinatario}: {asunto}")
-                return
-                
-            msg = MimeMultipart()
-            msg['From'] = app.config['MAIL_USERNAME']
-            msg['To'] = destinatario
-            msg['Subject'] = asunto
-            
-            msg.attach(MimeText(cuerpo, 'html'))
-            
-            server = smtplib.SMTP(app.config['MAIL_SERVER'], app.config['MAIL_PORT'])
-            server.starttls()
-            server.login(app.config['MAIL_USERNAME'], app.config['MAIL_PASSWORD'])
-            text = msg.as_string()
-            server.sendmail(app.config['MAIL_USERNAME'], destinatario, text)
-            server.quit()
-            
-            print(f"✅ Email enviado a {destinatario}")
-        except Exception as e:
-            print(f"❌ Error enviando email: {e}")
+    """Encolar email para que lo envíe el worker"""
+    encolar('enviar_email', destinatario=destinatario, asunto=asunto, cuerpo=cuerpo)
+
+@trabajo('enviar_email')
+def enviar_email_smtp(destinatario, asunto, cuerpo):
+    """Enviar email por SMTP (en el worker; los errores se reintentan)"""
+    if app.config['MAIL_USERNAME'] == 'test@gmail.com':
+        print(f"📧 [DEMO] Email a {destinatario}: {asunto}")
+        return
+        
+    msg = MIMEMultipart()
+    msg['From'] = app.config['MAIL_USERNAME']
+    msg['To'] = destinatario
+    msg['Subject'] = asunto
+    
+    msg.attach(MIMEText(cuerpo, 'html'))
     
-    threading.Thread(target=enviar).start()
+    server = smtplib.SMTP(app.config['MAIL_SERVER'], app.config['MAIL_PORT'], timeout=app.config['MAIL_TIMEOUT'])
+    server.starttls()
+    server.login(app.config['MAIL_USERNAME'], app.config['MAIL_PASSWORD'])
+    text = msg.as_string()
+    server.sendmail(app.config['MAIL_USERNAME'], destinatario, text)
+    server.quit()
+    
+    print(f"✅ Email enviado a {destinatario}")
 
 def notificar_tarea_completada(estudiante_nombre, tarea_titulo):
     """Notificar al profesor cuando un estudiante completa una tarea"""
@@ -129,6 +247,19 @@ def enviar_nueva_tarea_email(estudiante_email, estudiante_nombre, tarea_titulo,
     """
     enviar_email(estudiante_email, asunto, cuerpo)
 
+@trabajo('notificar_nueva_tarea')
+def notificar_nueva_tarea(tarea_id, estudiantes_ids):
+    """Encolar un email por cada estudiante asignado a la tarea"""
+    tarea = Tarea.query.get(tarea_id)
+    if tarea is None or tarea.fecha_limite is None:
+        return
+    
+    dias_limite = (tarea.fecha_limite - datetime.now()).days
+    estudiantes_asignados = Usuario.query.filter(Usuario.id.in_(estudiantes_ids)).all()
+    for estudiante in estudiantes_asignados:
+        if estudiante.email:
+            enviar_nueva_tarea_email(estudiante.email, estudiante.nombre, tarea.titulo, tarea.descripcion, dias_limite)
+
 def notificar_recordatorio_tarea(estudiante_email, estudiante_nombre, tarea_titulo, dias_restantes):
     """Enviar recordatorio a estudiante de tarea próxima a vencer"""
     asunto = f"⏰ RECORDATORIO: {tarea_titulo}"
@@ -154,39 +285,562 @@ def notificar_recordatorio_tarea(estudiante_email, estudiante_nombre, tarea_titu
     """
     enviar_email(estudiante_email, asunto, cuerpo)
 
+@trabajo('verificar_recordatorios')
 def verificar_recordatorios():
     """Verificar tareas que necesitan recordatorio (2 días antes de vencer)"""
+    fecha_limite = datetime.now() + timedelta(days=2)
+    
+    tareas_proximas = db.session.query(TareaUsuario, Tarea, Usuario).join(Tarea).join(Usuario).filter(
+        Tarea.fecha_limite.isnot(None),
+        Tarea.fecha_limite <= fecha_limite,
+        Tarea.fecha_limite > datetime.now(),
+        TareaUsuario.completada == False
+    ).all()
+    
+    for tarea_usuario, tarea, usuario in tareas_proximas:
+        if usuario.email:
+            dias_restantes = (tarea.fecha_limite - datetime.now()).days
+            notificar_recordatorio_tarea(usuario.email, usuario.nombre, tarea.titulo, dias_restantes)
+
+@trabajo('limpiar_trabajos')
+def limpiar_trabajos():
+    """Borrar trabajos terminados más antiguos que la retención configurada"""
+    limite = datetime.utcnow() - timedelta(days=app.config['TRABAJOS_RETENCION_DIAS'])
+    Trabajo.query.filter(
+        Trabajo.estado.in_(['completado', 'fallido']),
+        Trabajo.fecha_fin < limite
+    ).delete(synchronize_session=False)
+
+# Búsqueda de tareas
+BUSQUEDA_LIMITE_DEFAULT = 20
+BUSQUEDA_LIMITE_MAX = 100
+
+# Vector de búsqueda en Postgres; el índice GIN usa exactamente esta expresión
+TSVECTOR_TAREA = (
+    "setweight(to_tsvector('spanish', coalesce(titulo, '')), 'A') || "
+    "setweight(to_tsvector('spanish', coalesce(descripcion, '')), 'B')"
+)
+
+def init_busqueda():
+    """Crear el índice de texto completo: FTS5 con triggers en SQLite, GIN sobre tsvector en Postgres"""
+    # Índices nuevos en tablas existentes (create_all no los agrega)
+    for indice in TareaUsuario.__table__.indexes:
+        indice.create(bind=db.engine, checkfirst=True)
+
+    dialecto = db.engine.dialect.name
     try:
-        fecha_limite = datetime.now() + timedelta(days=2)
-        
-        tareas_proximas = db.session.query(TareaUsuario, Tarea, Usuario).join(Tarea).join(Usuario).filter(
-            Tarea.fecha_limite.isnot(None),
-            Tarea.fecha_limite <= fecha_limite,
-            Tarea.fecha_limite > datetime.now(),
-            TareaUsuario.completada == False
-        ).all()
+        if dialecto == 'sqlite':
+            crear_indice_fts5()
+        elif dialecto == 'postgresql':
+            db.session.execute(db.text(
+                f"CREATE INDEX IF NOT EXISTS ix_tarea_busqueda ON tarea USING GIN (({TSVECTOR_TAREA}))"
+            ))
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        print(f"⚠️ Índice de texto completo no disponible, usando búsqueda LIKE: {e}")
+
+    app.config.pop('BUSQUEDA_MOTOR', None)
+    motor_busqueda()
+
+def crear_indice_fts5():
+    """Tabla FTS5 de contenido externo sobre tarea, sincronizada con triggers"""
+    existe = db.session.execute(db.text(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tarea_fts'"
+    )).first()
+
+    db.session.execute(db.text("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS tarea_fts USING fts5(
+            titulo, descripcion,
+            content='tarea', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2'
+        )
+    """))
+    db.session.execute(db.text("""
+        CREATE TRIGGER IF NOT EXISTS tarea_fts_ai AFTER INSERT ON tarea BEGIN
+            INSERT INTO tarea_fts(rowid, titulo, descripcion)
+            VALUES (new.id, new.titulo, new.descripcion);
+        END
+    """))
+    db.session.execute(db.text("""
+        CREATE TRIGGER IF NOT EXISTS tarea_fts_ad AFTER DELETE ON tarea BEGIN
+            INSERT INTO tarea_fts(tarea_fts, rowid, titulo, descripcion)
+            VALUES ('delete', old.id, old.titulo, old.descripcion);
+        END
+    """))
+    db.session.execute(db.text("""
+        CREATE TRIGGER IF NOT EXISTS tarea_fts_au AFTER UPDATE ON tarea BEGIN
+            INSERT INTO tarea_fts(tarea_fts, rowid, titulo, descripcion)
+            VALUES ('delete', old.id, old.titulo, old.descripcion);
+            INSERT INTO tarea_fts(rowid, titulo, descripcion)
+            VALUES (new.id, new.titulo, new.descripcion);
+        END
+    """))
+
+    # Indexar tareas que ya existían antes del índice
+    if not existe:
+        db.session.execute(db.text("INSERT INTO tarea_fts(tarea_fts) VALUES ('rebuild')"))
+
+def motor_busqueda():
+    """Detectar una sola vez por proceso qué índice existe (aunque init_db no haya corrido aquí)"""
+    if 'BUSQUEDA_MOTOR' not in app.config:
+        dialecto = db.engine.dialect.name
+        motor = 'like'
+        if dialecto == 'sqlite' and db.session.execute(db.text(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tarea_fts'"
+        )).first():
+            motor = 'fts5'
+        elif dialecto == 'postgresql' and db.session.execute(db.text(
+            "SELECT 1 FROM pg_indexes WHERE tablename = 'tarea' AND indexname = 'ix_tarea_busqueda'"
+        )).first():
+            motor = 'postgres'
+        app.config['BUSQUEDA_MOTOR'] = motor
+    return app.config['BUSQUEDA_MOTOR']
+
+def patron_like(termino):
+    """Patrón LIKE que trata %, _ y \\ del usuario como texto literal"""
+    escapado = termino.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f'%{escapado}%'
+
+def parsear_cursor(cursor):
+    """Convertir cursor 'puntaje:id' en tupla, None si no hay cursor"""
+    if not cursor:
+        return None
+    puntaje, tarea_id = cursor.rsplit(':', 1)
+    return float(puntaje), int(tarea_id)
+
+def paginar_resultados(subconsulta, params, usuario_id, cursor, limite):
+    """Filtrar por estudiante y cursor una subconsulta (id, puntaje); menor puntaje = más relevante"""
+    params = dict(params, limite=limite + 1)
+
+    filtro_usuario = ''
+    if usuario_id is not None:
+        filtro_usuario = """
+            AND EXISTS (SELECT 1 FROM tarea_usuario tu
+                        WHERE tu.usuario_id = :usuario_id AND tu.tarea_id = r.id)
+        """
+        params['usuario_id'] = usuario_id
+
+    filtro_cursor = ''
+    if cursor:
+        filtro_cursor = "AND (r.puntaje > :puntaje OR (r.puntaje = :puntaje AND r.id > :id))"
+        params['puntaje'], params['id'] = cursor
+
+    filas = db.session.execute(db.text(f"""
+        SELECT r.id, r.puntaje FROM ({subconsulta}) r
+        WHERE 1 = 1 {filtro_usuario} {filtro_cursor}
+        ORDER BY r.puntaje, r.id
+        LIMIT :limite
+    """), params).all()
+
+    return [(fila.id, fila.puntaje) for fila in filas]
+
+def buscar_tareas_fts(terminos, usuario_id, cursor, limite):
+    """Buscar con FTS5, ordenado por bm25 (título pesa más que descripción)"""
+    consulta = ' '.join('"' + termino.replace('"', '""') + '"*' for termino in terminos)
+    subconsulta = """
+        SELECT rowid AS id, bm25(tarea_fts, 10.0, 1.0) AS puntaje
+        FROM tarea_fts WHERE tarea_fts MATCH :consulta
+    """
+    return paginar_resultados(subconsulta, {'consulta': consulta}, usuario_id, cursor, limite)
+
+def buscar_tareas_postgres(terminos, usuario_id, cursor, limite):
+    """Buscar con tsvector + índice GIN, ordenado por ts_rank (negado para ordenar ascendente)"""
+    # Solo letras y dígitos: cualquier otro carácter es sintaxis de tsquery
+    palabras = [p for t in terminos for p in re.findall(r'[^\W_]+', t)]
+    if not palabras:
+        return []
+    consulta = ' & '.join(f'{palabra}:*' for palabra in palabras)
+    subconsulta = f"""
+        SELECT t.id, -ts_rank({TSVECTOR_TAREA}, q)::float8 AS puntaje
+        FROM tarea t, to_tsquery('spanish', :consulta) q
+        WHERE ({TSVECTOR_TAREA}) @@ q
+    """
+    return paginar_resultados(subconsulta, {'consulta': consulta}, usuario_id, cursor, limite)
+
+def buscar_tareas_like(terminos, usuario_id, cursor, limite):
+    """Búsqueda LIKE para bases sin índice de texto completo; coincidencias en título primero"""
+    patrones = [patron_like(t) for t in terminos]
+    en_titulo = db.and_(*[Tarea.titulo.ilike(p, escape='\\') for p in patrones])
+    puntaje = db.case((en_titulo, 0.0), else_=1.0)
+
+    query = db.session.query(Tarea.id, puntaje.label('puntaje')).filter(*[
+        db.or_(Tarea.titulo.ilike(p, escape='\\'), Tarea.descripcion.ilike(p, escape='\\'))
+        for p in patrones
+    ])
+
+    if usuario_id is not None:
+        query = query.filter(db.exists().where(
+            TareaUsuario.tarea_id == Tarea.id,
+            TareaUsuario.usuario_id == usuario_id
+        ))
+
+    if cursor:
+        query = query.filter(db.or_(
+            puntaje > cursor[0],
+            db.and_(puntaje == cursor[0], Tarea.id > cursor[1])
+        ))
+
+    filas = query.order_by(puntaje, Tarea.id).limit(limite + 1).all()
+    return [(fila.id, fila.puntaje) for fila in filas]
+
+# Caché HTTP
+TIPOS_COMPRIMIBLES = {
+    'text/html', 'text/css', 'text/plain', 'text/csv',
+    'application/json', 'application/javascript', 'text/javascript', 'image/svg+xml'
+}
+CACHE_INMUTABLE_SEGUNDOS = 365 * 24 * 3600
+
+def version_pagina():
+    """Versión de los datos que lee la página del usuario en sesión"""
+    if session.get('es_admin'):
+        # Los paneles de admin leen todo; la suma de contadores crecientes cambia con cualquier escritura
+        return db.session.execute(db.select(db.func.sum(VersionDatos.version))).scalar() or 0
+
+    # Un estudiante solo ve sus asignaciones y las tareas
+    propio = f"usuario:{session['user_id']}"
+    versiones = dict(db.session.execute(
+        db.select(VersionDatos.ambito, VersionDatos.version)
+        .where(VersionDatos.ambito.in_(['tareas', propio]))
+    ).all())
+    return f"{versiones.get('tareas', 0)}.{versiones.get(propio, 0)}"
+
+def etag_por_version():
+    """ETag a partir de la versión de datos, el usuario y la URL (sin renderizar la página)"""
+    version = version_pagina()
+    clave = f"{app.config['DEPLOY_ID']}:{version}:{session['user_id']}:{session.get('es_admin')}:{request.full_path}"
+    return hashlib.sha1(clave.encode()).hexdigest()[:20]
+
+def cache_por_version(vista):
+    """Responder 304 si los datos no cambiaron desde la última visita"""
+    @wraps(vista)
+    def envoltura(*args, **kwargs):
+        # Los mensajes flash se consumen al renderizar; no cachear esas páginas
+        if 'user_id' not in session or '_flashes' in session:
+            return vista(*args, **kwargs)
+
+        etag = etag_por_version()
+        if request.if_none_match.contains_weak(etag):
+            respuesta = app.response_class(status=304)
+            respuesta.set_etag(etag, weak=True)
+            respuesta.vary.add('Accept-Encoding')
+            return respuesta
+
+        respuesta = app.make_response(vista(*args, **kwargs))
+        if respuesta.status_code == 200:
+            respuesta.set_etag(etag, weak=True)
+        return respuesta
+    return envoltura
+
+def comprimir_respuesta(respuesta):
+    """Comprimir con brotli o gzip si el cliente lo acepta y el cuerpo es grande"""
+    if (respuesta.status_code != 200
+            or respuesta.direct_passthrough
+            or respuesta.is_streamed
+            or 'Content-Encoding' in respuesta.headers
+            or respuesta.mimetype not in TIPOS_COMPRIMIBLES):
+        return respuesta
+
+    respuesta.vary.add('Accept-Encoding')
+
+    cuerpo = respuesta.get_data()
+    if len(cuerpo) < app.config['COMPRESION_MINIMO']:
+        return respuesta
+
+    if brotli is not None and request.accept_encodings['br']:
+        cuerpo = brotli.compress(cuerpo, quality=app.config['COMPRESION_NIVEL_BROTLI'])
+        codificacion = 'br'
+    elif request.accept_encodings['gzip']:
+        cuerpo = gzip.compress(cuerpo, compresslevel=app.config['COMPRESION_NIVEL_GZIP'])
+        codificacion = 'gzip'
+    else:
+        return respuesta
+
+    respuesta.set_data(cuerpo)
+    respuesta.headers['Content-Encoding'] = codificacion
+    return respuesta
+
+EXTENSIONES_PRECOMPRIMIDAS = (('br', '.br'), ('gzip', '.gz'))
+
+def cargar_assets_vendor():
+    """Manifiesto {nombre: huella} de static/vendor, calculado una vez al iniciar"""
+    manifiesto = {}
+    for raiz, _, archivos in os.walk(app.config['VENDOR_DIR']):
+        for archivo in archivos:
+            # Las versiones .br/.gz se sirven junto al original, no por separado
+            if archivo.endswith(('.br', '.gz')):
+                continue
+            ruta = os.path.join(raiz, archivo)
+            nombre = os.path.relpath(ruta, app.config['VENDOR_DIR']).replace(os.sep, '/')
+            with open(ruta, 'rb') as f:
+                manifiesto[nombre] = hashlib.sha256(f.read()).hexdigest()[:12]
+    return manifiesto
+
+ASSETS_VENDOR = cargar_assets_vendor()
+
+def huella_despliegue():
+    """Identificador estable del código y los assets: igual en todos los procesos y tras reiniciar"""
+    with open(os.path.abspath(__file__), 'rb') as f:
+        contenido = f.read()
+    contenido += json.dumps(ASSETS_VENDOR, sort_keys=True).encode()
+    return hashlib.sha1(contenido).hexdigest()[:12]
+
+app.config['DEPLOY_ID'] = os.environ.get('RENDER_GIT_COMMIT') or huella_despliegue()
+
+@app.template_global()
+def asset_url(nombre, cdn_url):
+    """URL con huella del asset vendorizado, o la del CDN si no está en static/vendor"""
+    huella = ASSETS_VENDOR.get(nombre)
+    if huella is None:
+        return cdn_url
+    return url_for('asset', huella=huella, nombre=nombre)
+
+# Worker de trabajos
+def valores_cron(campo, minimo, maximo):
+    """Expandir un campo cron (*, 5, 1-5, */15, 1,15) a un conjunto de valores"""
+    valores = set()
+    for parte in campo.split(','):
+        rango, _, paso = parte.partition('/')
+        paso = int(paso) if paso else 1
+        if rango == '*':
+            inicio, fin = minimo, maximo
+        elif '-' in rango:
+            inicio, fin = map(int, rango.split('-'))
+        else:
+            inicio = int(rango)
+            fin = maximo if paso > 1 else inicio
+        if paso < 1 or inicio < minimo or fin > maximo or inicio > fin:
+            raise ValueError(f"Campo cron fuera de rango: {campo!r}")
+        valores.update(range(inicio, fin + 1, paso))
+    return valores
+
+def parsear_cron(expresion):
+    """Validar y expandir una expresión cron de 5 campos (ValueError si es inválida)"""
+    campos = expresion.split()
+    if len(campos) != 5:
+        raise ValueError(f"Se esperaban 5 campos cron: {expresion!r}")
+    minuto, hora, dia, mes, dia_semana = campos
+    return {
+        'minuto': valores_cron(minuto, 0, 59),
+        'hora': valores_cron(hora, 0, 23),
+        'dia': valores_cron(dia, 1, 31),
+        'mes': valores_cron(mes, 1, 12),
+        # En cron el domingo es 0 (o 7); en Python es weekday() == 6
+        'dia_semana': {d % 7 for d in valores_cron(dia_semana, 0, 7)},
+        # Igual que cron: si día y día de semana están restringidos, basta con uno
+        'dia_o_semana': dia != '*' and dia_semana != '*'
+    }
+
+def cron_coincide(expresion, fecha):
+    """Indicar si una expresión cron de 5 campos coincide con el minuto dado"""
+    cron = parsear_cron(expresion)
+    coincide_dia = fecha.day in cron['dia']
+    coincide_semana = (fecha.weekday() + 1) % 7 in cron['dia_semana']
+    
+    if cron['dia_o_semana']:
+        coincide_fecha = coincide_dia or coincide_semana
+    else:
+        coincide_fecha = coincide_dia and coincide_semana
+    
+    return (fecha.minute in cron['minuto']
+            and fecha.hour in cron['hora']
+            and fecha.month in cron['mes']
+            and coincide_fecha)
+
+def validar_programaciones():
+    """Revisar al iniciar el worker que cada programación sea válida y tenga trabajo registrado"""
+    for nombre, expresion in PROGRAMACIONES:
+        if nombre not in TRABAJOS:
+            raise ValueError(f"Programación de un trabajo no registrado: {nombre}")
+        parsear_cron(expresion)
+
+def programar_trabajos(minuto):
+    """Encolar los trabajos programados para este minuto (una sola vez entre todos los workers)"""
+    for nombre, expresion in PROGRAMACIONES:
+        # Una programación inválida no debe frenar a las demás ni al avance de minutos
+        try:
+            if not cron_coincide(expresion, minuto):
+                continue
+        except ValueError as e:
+            print(f"❌ Programación inválida {nombre}: {e}")
+            continue
+        try:
+            encolar(nombre, ejecutar_en=minuto, clave_unica=f"{nombre}@{minuto:%Y-%m-%dT%H:%M}")
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+
+def liberar_trabajos_colgados():
+    """Regresar a la cola trabajos sin latido (worker muerto) o que pasaron la duración máxima (colgados)"""
+    ahora = datetime.utcnow()
+    colgados = (
+        Trabajo.estado == 'en_proceso',
+        db.or_(
+            Trabajo.latido < ahora - timedelta(seconds=app.config['TRABAJOS_TIMEOUT']),
+            Trabajo.fecha_inicio < ahora - timedelta(seconds=app.config['TRABAJOS_DURACION_MAX'])
+        )
+    )
+    # Quitar el worker hace que el proceso original, si sigue vivo, no pueda cerrar el trabajo
+    db.session.execute(
+        db.update(Trabajo)
+        .where(*colgados, Trabajo.intentos < Trabajo.max_intentos)
+        .values(estado='pendiente', ejecutar_en=ahora, worker=None,
+                error='Tiempo agotado: worker sin respuesta o trabajo colgado')
+    )
+    db.session.execute(
+        db.update(Trabajo)
+        .where(*colgados, Trabajo.intentos >= Trabajo.max_intentos)
+        .values(estado='fallido', fecha_fin=ahora, worker=None,
+                error='Tiempo agotado: worker sin respuesta o trabajo colgado')
+    )
+    db.session.commit()
+
+def reclamar_trabajo(nombre_worker):
+    """Tomar el siguiente trabajo pendiente; el UPDATE condicional evita que dos workers tomen el mismo"""
+    while True:
+        ahora = datetime.utcnow()
+        candidato = db.session.execute(
+            db.select(Trabajo.id)
+            .where(Trabajo.estado == 'pendiente', Trabajo.ejecutar_en <= ahora)
+            .order_by(Trabajo.ejecutar_en, Trabajo.id)
+            .limit(1)
+        ).scalar()
+        if candidato is None:
+            return None
         
-        for tarea_usuario, tarea, usuario in tareas_proximas:
-            if usuario.email:
-                dias_restantes = (tarea.fecha_limite - datetime.now()).days
-                notificar_recordatorio_tarea(usuario.email, usuario.nombre, tarea.titulo, dias_restantes)
+        resultado = db.session.execute(
+            db.update(Trabajo)
+            .where(Trabajo.id == candidato, Trabajo.estado == 'pendiente')
+            .values(estado='en_proceso', fecha_inicio=ahora, latido=ahora,
+                    worker=nombre_worker, intentos=Trabajo.intentos + 1)
+        )
+        db.session.commit()
+        if resultado.rowcount == 1:
+            return db.session.get(Trabajo, candidato)
+
+def mantener_latido(engine, trabajo_id, nombre_worker, intervalo, duracion_max, detener):
+    """Actualizar el latido del trabajo mientras corre, en su propia conexión, hasta la duración máxima"""
+    fin = time.monotonic() + duracion_max
+    while not detener.wait(intervalo) and time.monotonic() < fin:
+        try:
+            with engine.begin() as conexion:
+                conexion.execute(
+                    db.update(Trabajo)
+                    .where(Trabajo.id == trabajo_id, Trabajo.worker == nombre_worker,
+                           Trabajo.estado == 'en_proceso')
+                    .values(latido=datetime.utcnow())
+                )
+        except Exception as e:
+            print(f"⚠️ No se pudo registrar latido del trabajo #{trabajo_id}: {e}")
+
+def ejecutar_trabajo(pendiente, nombre_worker):
+    """Ejecutar un trabajo reclamado, registrar su duración y reprogramar si falla"""
+    trabajo_id, nombre, intentos = pendiente.id, pendiente.nombre, pendiente.intentos
+    
+    detener = threading.Event()
+    latido = threading.Thread(
+        target=mantener_latido,
+        args=(db.engine, trabajo_id, nombre_worker, app.config['TRABAJOS_LATIDO'],
+              app.config['TRABAJOS_DURACION_MAX'], detener),
+        daemon=True
+    )
+    latido.start()
+    
+    inicio = time.perf_counter()
+    try:
+        funcion = TRABAJOS.get(nombre)
+        if funcion is None:
+            raise LookupError(f"Trabajo no registrado: {nombre}")
+        funcion(**json.loads(pendiente.argumentos or '{}'))
+        valores = {'estado': 'completado', 'error': None}
     except Exception as e:
-        print(f"❌ Error verificando recordatorios: {e}")
+        # Descartar cambios parciales del trabajo (incluidos trabajos que haya encolado)
+        db.session.rollback()
+        valores = {'error': f"{type(e).__name__}: {e}"}
+        if intentos < pendiente.max_intentos:
+            espera = app.config['TRABAJOS_REINTENTO_BASE'] * 2 ** (intentos - 1)
+            valores.update(estado='pendiente', ejecutar_en=datetime.utcnow() + timedelta(seconds=espera))
+        else:
+            valores['estado'] = 'fallido'
+        print(f"❌ Error en trabajo {nombre} #{trabajo_id} (intento {intentos}): {e}")
+    finally:
+        detener.set()
+        latido.join()
+    
+    valores.update(fecha_fin=datetime.utcnow(), duracion_ms=(time.perf_counter() - inicio) * 1000)
+    # Solo cerrar el trabajo si sigue siendo nuestro; si otro worker lo liberó, descartar lo hecho
+    resultado = db.session.execute(
+        db.update(Trabajo)
+        .where(Trabajo.id == trabajo_id, Trabajo.worker == nombre_worker,
+               Trabajo.estado == 'en_proceso')
+        .values(**valores)
+    )
+    if resultado.rowcount != 1:
+        db.session.rollback()
+        print(f"⚠️ Trabajo {nombre} #{trabajo_id} fue liberado por otro worker; se descarta su resultado")
+        return
+    db.session.commit()
+
+def ejecutar_worker(intervalo, una_vez=False):
+    """Ciclo principal del worker: programar, reclamar y ejecutar trabajos"""
+    nombre_worker = f"{socket.gethostname()}:{os.getpid()}"
+    ultimo_minuto = None
+    
+    while True:
+        try:
+            ahora = datetime.utcnow().replace(second=0, microsecond=0)
+            if ultimo_minuto is None:
+                ultimo_minuto = ahora - timedelta(minutes=1)
+            if ultimo_minuto < ahora:
+                # Revisar también los minutos que pasaron mientras corría un trabajo largo
+                while ultimo_minuto < ahora:
+                    programar_trabajos(ultimo_minuto + timedelta(minutes=1))
+                    ultimo_minuto += timedelta(minutes=1)
+                liberar_trabajos_colgados()
+            
+            pendiente = reclamar_trabajo(nombre_worker)
+            if pendiente is not None:
+                ejecutar_trabajo(pendiente, nombre_worker)
+                continue
+        except Exception as e:
+            # Errores transitorios de la base (p. ej. "database is locked") no deben tumbar el worker
+            print(f"❌ Error en el worker: {e}")
+            # remove() cierra la sesión y hace rollback aunque la conexión esté rota
+            db.session.remove()
+            if una_vez:
+                return
+            time.sleep(intervalo)
+            continue
+        
+        if una_vez:
+            return
+        db.session.remove()
+        time.sleep(intervalo)
 
-def iniciar_verificador_recordatorios():
-    """Iniciar verificador de recordatorios"""
-    def verificar_periodicamente():
-        while True:
-            with app.app_context():
-                verificar_recordatorios()
-            time.sleep(3600)  # Cada hora
+def estadisticas_trabajos():
+    """Conteos por estado y tiempos de ejecución por tipo de trabajo"""
+    filas = db.session.query(
+        Trabajo.nombre,
+        Trabajo.estado,
+        db.func.count(Trabajo.id),
+        db.func.avg(Trabajo.duracion_ms),
+        db.func.max(Trabajo.duracion_ms)
+    ).group_by(Trabajo.nombre, Trabajo.estado).all()
     
-    threading.Thread(target=verificar_periodicamente, daemon=True).start()
+    stats = {}
+    for nombre, estado, total, promedio_ms, maximo_ms in filas:
+        stats.setdefault(nombre, {})[estado] = {
+            'total': total,
+            'promedio_ms': round(promedio_ms, 1) if promedio_ms is not None else None,
+            'maximo_ms': round(maximo_ms, 1) if maximo_ms is not None else None
+        }
+    return stats
 
 def init_db():
     with app.app_context():
         db.create_all()
-        
+        init_busqueda()
+
         # Admin
         if not Usuario.query.filter_by(matricula='ADMIN').first():
             admin = Usuario(
@@ -226,6 +880,46 @@ def init_db():
         db.session.commit()
 
 # Rutas
+@app.after_request
+def aplicar_cabeceras_cache(respuesta):
+    # Los assets son públicos: no tocar la sesión (agregaría Vary: Cookie)
+    if request.endpoint == 'asset':
+        return respuesta
+    
+    # Páginas con sesión: solo caché del navegador y siempre revalidar
+    if 'user_id' in session and 'Cache-Control' not in respuesta.headers:
+        respuesta.cache_control.private = True
+        respuesta.cache_control.no_cache = True
+        respuesta.vary.add('Cookie')
+    return comprimir_respuesta(respuesta)
+
+@app.route('/assets/<huella>/<path:nombre>')
+def asset(huella, nombre):
+    if ASSETS_VENDOR.get(nombre) != huella:
+        abort(404)
+    
+    ruta = os.path.join(app.config['VENDOR_DIR'], *nombre.split('/'))
+    mimetype = mimetypes.guess_type(nombre)[0] or 'application/octet-stream'
+    
+    # Preferir versiones precomprimidas (bootstrap.min.css.br / .gz) si existen
+    codificacion = None
+    for posible, extension in EXTENSIONES_PRECOMPRIMIDAS:
+        if request.accept_encodings[posible] and os.path.isfile(ruta + extension):
+            codificacion, ruta = posible, ruta + extension
+            break
+    
+    with open(ruta, 'rb') as f:
+        respuesta = app.response_class(f.read(), mimetype=mimetype)
+    respuesta.cache_control.public = True
+    respuesta.cache_control.max_age = CACHE_INMUTABLE_SEGUNDOS
+    respuesta.cache_control.immutable = True
+    
+    if codificacion:
+        respuesta.headers['Content-Encoding'] = codificacion
+        respuesta.vary.add('Accept-Encoding')
+        return respuesta
+    return comprimir_respuesta(respuesta)
+
 @app.route('/')
 def index():
     if 'user_id' in session:
@@ -264,6 +958,7 @@ def dashboard():
         return redirect(url_for('student_dashboard'))
 
 @app.route('/admin/dashboard')
+@cache_por_version
 def admin_dashboard():
     if 'user_id' not in session or not session['es_admin']:
         return redirect(url_for('index'))
@@ -285,6 +980,7 @@ def admin_dashboard():
     return render_template('admin_dashboard.html', stats=stats, estudiantes=estudiantes)
 
 @app.route('/student/dashboard')
+@cache_por_version
 def student_dashboard():
     if 'user_id' not in session or session['es_admin']:
         return redirect(url_for('index'))
@@ -317,15 +1013,11 @@ def crear_tarea():
             asignacion = TareaUsuario(usuario_id=int(estudiante_id), tarea_id=tarea.id)
             db.session.add(asignacion)
         
-        db.session.commit()
-        
-        # Enviar emails a estudiantes
+        # Los emails a estudiantes los envía el worker
         if fecha_limite:
-            estudiantes_asignados = Usuario.query.filter(Usuario.id.in_(estudiantes_ids)).all()
-            for estudiante in estudiantes_asignados:
-                if estudiante.email:
-                    dias_limite = (datetime.strptime(fecha_limite, '%Y-%m-%d') - datetime.now()).days
-                    enviar_nueva_tarea_email(estudiante.email, estudiante.nombre, titulo, descripcion, dias_limite)
+            encolar('notificar_nueva_tarea', tarea_id=tarea.id, estudiantes_ids=[int(i) for i in estudiantes_ids])
+        
+        db.session.commit()
         
         flash(f'Tarea creada y enviada a {len(estudiantes_ids)} estudiantes por email')
         return redirect(url_for('admin_dashboard'))
@@ -347,12 +1039,14 @@ def completar_tarea(tarea_usuario_id):
     tarea_usuario.completada = not tarea_usuario.completada
     tarea_usuario.fecha_completada = datetime.utcnow() if tarea_usuario.completada else None
     
-    db.session.commit()
-    
     if tarea_usuario.completada:
         usuario = Usuario.query.get(session['user_id'])
         tarea = Tarea.query.get(tarea_usuario.tarea_id)
         notificar_tarea_completada(usuario.nombre, tarea.titulo)
+    
+    db.session.commit()
+    
+    if tarea_usuario.completada:
         flash('✅ Tarea completada y profesor notificado')
     else:
         flash('Tarea marcada como pendiente')
@@ -360,6 +1054,7 @@ def completar_tarea(tarea_usuario_id):
     return redirect(url_for('student_dashboard'))
 
 @app.route('/admin/reporte/<int:estudiante_id>')
+@cache_por_version
 def reporte_estudiante(estudiante_id):
     if 'user_id' not in session or not session['es_admin']:
         return redirect(url_for('index'))
@@ -378,6 +1073,136 @@ def reporte_estudiante(estudiante_id):
                          completadas=completadas,
                          porcentaje=porcentaje)
 
+@app.route('/buscar')
+def buscar():
+    if 'user_id' not in session:
+        return jsonify({'error': 'Inicia sesión para buscar'}), 401
+
+    terminos = request.args.get('q', '').split()
+    if not terminos:
+        return jsonify({'resultados': [], 'siguiente': None})
+
+    try:
+        cursor = parsear_cursor(request.args.get('cursor'))
+        limite = int(request.args.get('limite', BUSQUEDA_LIMITE_DEFAULT))
+    except ValueError:
+        return jsonify({'error': 'Parámetros de paginación inválidos'}), 400
+    limite = max(1, min(limite, BUSQUEDA_LIMITE_MAX))
+
+    # Los estudiantes solo ven sus propias asignaciones
+    usuario_id = None if session['es_admin'] else session['user_id']
+
+    motor = motor_busqueda()
+    if motor == 'fts5':
+        filas = buscar_tareas_fts(terminos, usuario_id, cursor, limite)
+    elif motor == 'postgres':
+        filas = buscar_tareas_postgres(terminos, usuario_id, cursor, limite)
+    else:
+        filas = buscar_tareas_like(terminos, usuario_id, cursor, limite)
+
+    siguiente = None
+    if len(filas) > limite:
+        filas = filas[:limite]
+        siguiente = f"{filas[-1][1]!r}:{filas[-1][0]}"
+
+    tareas = {t.id: t for t in Tarea.query.filter(Tarea.id.in_([f[0] for f in filas])).all()}
+
+    resultados = []
+    for tarea_id, puntaje in filas:
+        tarea = tareas.get(tarea_id)
+        if tarea is None:
+            continue
+        resultados.append({
+            'id': tarea.id,
+            'titulo': tarea.titulo,
+            'descripcion': tarea.descripcion,
+            'fecha_limite': tarea.fecha_limite.strftime('%Y-%m-%d') if tarea.fecha_limite else None
+        })
+
+    return jsonify({'resultados': resultados, 'siguiente': siguiente})
+
+@app.route('/admin/trabajos')
+def admin_trabajos():
+    if 'user_id' not in session or not session['es_admin']:
+        return redirect(url_for('index'))
+    
+    return jsonify(estadisticas_trabajos())
+
+# Comandos de consola
+@app.cli.command('worker')
+@click.option('--intervalo', default=5.0, help='Segundos de espera cuando no hay trabajos')
+@click.option('--una-vez', is_flag=True, help='Procesar los trabajos pendientes y salir')
+def worker_command(intervalo, una_vez):
+    """Ejecutar el worker de trabajos en segundo plano"""
+    try:
+        validar_programaciones()
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    init_db()
+    print(f"🤖 Worker iniciado ({len(TRABAJOS)} trabajos registrados)")
+    ejecutar_worker(intervalo, una_vez)
+
+@app.cli.command('init-db')
+def init_db_command():
+    """Crear tablas, índices de búsqueda y usuarios iniciales (idempotente)"""
+    init_db()
+    print("✅ Base de datos lista")
+
+@app.cli.command('importar-sqlite')
+@click.argument('ruta', type=click.Path(exists=True, dir_okay=False))
+def importar_sqlite_command(ruta):
+    """Copiar usuarios, tareas y asignaciones de un tareas.db de SQLite a la base actual"""
+    init_db()
+    if Tarea.query.first() is not None:
+        raise click.ClickException('La base destino ya tiene tareas; la importación es solo para una base nueva')
+    
+    origen = create_engine(f"sqlite:///{os.path.abspath(ruta)}")
+    with origen.connect() as conexion:
+        usuarios = conexion.execute(db.select(Usuario.__table__)).mappings().all()
+        tareas = conexion.execute(db.select(Tarea.__table__)).mappings().all()
+        asignaciones = conexion.execute(db.select(TareaUsuario.__table__)).mappings().all()
+    origen.dispose()
+    
+    # Los ids cambian: init_db ya creó admin y estudiantes, así que los usuarios se unen por matrícula
+    ids_usuario = {}
+    for fila in usuarios:
+        datos = {k: v for k, v in fila.items() if k != 'id'}
+        usuario = Usuario.query.filter_by(matricula=fila['matricula']).first()
+        if usuario is None:
+            usuario = Usuario(**datos)
+            db.session.add(usuario)
+        else:
+            for campo, valor in datos.items():
+                setattr(usuario, campo, valor)
+        db.session.flush()
+        ids_usuario[fila['id']] = usuario.id
+    
+    ids_tarea = {}
+    for fila in tareas:
+        tarea = Tarea(**{k: v for k, v in fila.items() if k != 'id'})
+        db.session.add(tarea)
+        db.session.flush()
+        ids_tarea[fila['id']] = tarea.id
+    
+    for fila in asignaciones:
+        db.session.add(TareaUsuario(
+            usuario_id=ids_usuario[fila['usuario_id']],
+            tarea_id=ids_tarea[fila['tarea_id']],
+            completada=fila['completada'],
+            fecha_completada=fila['fecha_completada']
+        ))
+    
+    db.session.commit()
+    print(f"✅ Importados {len(usuarios)} usuarios, {len(tareas)} tareas y {len(asignaciones)} asignaciones")
+
+@app.cli.command('trabajos-stats')
+def trabajos_stats_command():
+    """Mostrar estadísticas de la cola de trabajos"""
+    for nombre, estados in sorted(estadisticas_trabajos().items()):
+        print(f"📋 {nombre}")
+        for estado, datos in sorted(estados.items()):
+            print(f"   {estado:<12} {datos['total']:>6}  promedio {datos['promedio_ms']} ms  máximo {datos['maximo_ms']} ms")
+
 # Templates HTML
 templates = {
     'base.html': '''<!DOCTYPE html>
@@ -386,7 +1211,7 @@ templates = {
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Sistema de Tareas - Robótica</title>
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
+    <link href="{{ asset_url('bootstrap.min.css', 'https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css') }}" rel="stylesheet">
 </head>
 <body>
     <nav class="navbar navbar-expand-lg navbar-dark bg-dark">
@@ -416,7 +1241,7 @@ templates = {
         {% block content %}{% endblock %}
     </div>
     
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
+    <script src="{{ asset_url('bootstrap.bundle.min.js', 'https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js') }}"></script>
 </body>
 </html>''',
     
@@ -0,0 +1,180 @@
+import os
+
+# Base en memoria antes de importar la app (lee DATABASE_URL al importar)
+os.environ['DATABASE_URL'] = 'sqlite://'
+
+from datetime import datetime, timedelta
+
+import pytest
+
+import app as aplicacion
+from app import app, db, Trabajo
+
+
+@pytest.fixture
+def contexto(monkeypatch):
+    # Latido muy espaciado: el hilo de latidos no toca la base durante las pruebas
+    monkeypatch.setitem(app.config, 'TRABAJOS_LATIDO', 3600)
+    with app.app_context():
+        db.create_all()
+        yield
+        db.session.remove()
+        db.drop_all()
+
+
+def encolar_trabajo(nombre, **kwargs):
+    nuevo = aplicacion.encolar(nombre, **kwargs)
+    db.session.commit()
+    return nuevo.id
+
+
+def recargar(trabajo_id):
+    db.session.expire_all()
+    return db.session.get(Trabajo, trabajo_id)
+
+
+def trabajos_llamados(nombre):
+    return Trabajo.query.filter_by(nombre=nombre).count()
+
+
+# Expresiones cron
+def test_cron_minuto_y_hora():
+    assert aplicacion.cron_coincide('0 * * * *', datetime(2026, 10, 19, 5, 0))
+    assert not aplicacion.cron_coincide('0 * * * *', datetime(2026, 10, 19, 5, 1))
+    assert aplicacion.cron_coincide('30 3 * * *', datetime(2026, 10, 19, 3, 30))
+
+
+def test_cron_pasos():
+    assert aplicacion.cron_coincide('*/15 * * * *', datetime(2026, 1, 1, 1, 45))
+    # N/paso: desde N hasta el máximo
+    for minuto in (5, 25, 45):
+        assert aplicacion.cron_coincide('5/20 * * * *', datetime(2026, 1, 1, 1, minuto))
+    assert not aplicacion.cron_coincide('5/20 * * * *', datetime(2026, 1, 1, 1, 15))
+
+
+def test_cron_domingo_es_cero_y_siete():
+    domingo = datetime(2026, 10, 18, 0, 0)
+    assert aplicacion.cron_coincide('0 0 * * 0', domingo)
+    assert aplicacion.cron_coincide('0 0 * * 7', domingo)
+    assert not aplicacion.cron_coincide('0 0 * * 1', domingo)
+
+
+def test_cron_dia_o_dia_de_semana():
+    # Con ambos campos restringidos basta con que coincida uno
+    assert aplicacion.cron_coincide('0 0 1 * 1', datetime(2026, 10, 19, 0, 0))  # lunes
+    assert aplicacion.cron_coincide('0 0 1 * 1', datetime(2026, 11, 1, 0, 0))  # día 1, domingo
+    assert not aplicacion.cron_coincide('0 0 1 * 1', datetime(2026, 10, 20, 0, 0))
+    # Con día de semana libre solo cuenta el día del mes
+    assert not aplicacion.cron_coincide('0 0 1 * *', datetime(2026, 10, 19, 0, 0))
+
+
+@pytest.mark.parametrize('expresion', [
+    '* * * *', '60 * * * *', '*/0 * * * *', '5-1 * * * *', 'x * * * *', '0 0 32 * *'
+])
+def test_cron_invalido(expresion):
+    with pytest.raises(ValueError):
+        aplicacion.parsear_cron(expresion)
+
+
+# Programaciones
+def test_programacion_se_encola_una_vez_por_minuto(contexto, monkeypatch):
+    monkeypatch.setattr(aplicacion, 'PROGRAMACIONES', [('limpiar_trabajos', '* * * * *')])
+    minuto = datetime(2026, 10, 19, 5, 0)
+    aplicacion.programar_trabajos(minuto)
+    aplicacion.programar_trabajos(minuto)
+    assert trabajos_llamados('limpiar_trabajos') == 1
+
+
+def test_programacion_invalida_no_bloquea_las_demas(contexto, monkeypatch):
+    monkeypatch.setattr(aplicacion, 'PROGRAMACIONES', [
+        ('limpiar_trabajos', '61 * * * *'),
+        ('verificar_recordatorios', '* * * * *'),
+    ])
+    with pytest.raises(ValueError):
+        aplicacion.validar_programaciones()
+
+    aplicacion.programar_trabajos(datetime(2026, 10, 19, 5, 0))
+    assert trabajos_llamados('verificar_recordatorios') == 1
+
+
+# Reclamo, reintentos y liberación
+def test_trabajo_se_reclama_una_sola_vez(contexto):
+    trabajo_id = encolar_trabajo('limpiar_trabajos')
+    primero = aplicacion.reclamar_trabajo('w1')
+    assert primero.id == trabajo_id
+    assert aplicacion.reclamar_trabajo('w2') is None
+    assert recargar(trabajo_id).worker == 'w1'
+
+
+def test_reintento_con_espera_y_fallo_final(contexto, monkeypatch):
+    def falla():
+        raise RuntimeError('sin conexión')
+    monkeypatch.setitem(aplicacion.TRABAJOS, 'falla', falla)
+    trabajo_id = encolar_trabajo('falla', max_intentos=2)
+
+    aplicacion.ejecutar_trabajo(aplicacion.reclamar_trabajo('w1'), 'w1')
+    trabajo = recargar(trabajo_id)
+    assert trabajo.estado == 'pendiente'
+    assert trabajo.intentos == 1
+    assert trabajo.error == 'RuntimeError: sin conexión'
+    assert trabajo.ejecutar_en > datetime.utcnow() + timedelta(seconds=25)
+    assert aplicacion.reclamar_trabajo('w1') is None
+
+    trabajo.ejecutar_en = datetime.utcnow() - timedelta(seconds=1)
+    db.session.commit()
+    aplicacion.ejecutar_trabajo(aplicacion.reclamar_trabajo('w1'), 'w1')
+    trabajo = recargar(trabajo_id)
+    assert trabajo.estado == 'fallido'
+    assert trabajo.intentos == 2
+    assert trabajo.duracion_ms is not None
+
+
+def test_exito_guarda_trabajos_encolados(contexto, monkeypatch):
+    monkeypatch.setitem(aplicacion.TRABAJOS, 'padre', lambda: aplicacion.encolar('hijo'))
+    trabajo_id = encolar_trabajo('padre')
+
+    aplicacion.ejecutar_trabajo(aplicacion.reclamar_trabajo('w1'), 'w1')
+    assert recargar(trabajo_id).estado == 'completado'
+    assert trabajos_llamados('hijo') == 1
+
+
+def test_trabajo_sin_latido_se_libera_y_descarta_resultado_tardio(contexto, monkeypatch):
+    monkeypatch.setitem(aplicacion.TRABAJOS, 'padre', lambda: aplicacion.encolar('hijo'))
+    trabajo_id = encolar_trabajo('padre')
+    pendiente = aplicacion.reclamar_trabajo('w1')
+
+    pendiente.latido = datetime.utcnow() - timedelta(seconds=app.config['TRABAJOS_TIMEOUT'] + 1)
+    db.session.commit()
+    aplicacion.liberar_trabajos_colgados()
+    trabajo = recargar(trabajo_id)
+    assert trabajo.estado == 'pendiente'
+    assert trabajo.worker is None
+
+    # El worker original termina tarde: no debe pisar el estado ni encolar nada
+    aplicacion.ejecutar_trabajo(pendiente, 'w1')
+    assert recargar(trabajo_id).estado == 'pendiente'
+    assert trabajos_llamados('hijo') == 0
+
+
+def test_trabajo_colgado_se_libera_aunque_mande_latidos(contexto):
+    trabajo_id = encolar_trabajo('limpiar_trabajos')
+    pendiente = aplicacion.reclamar_trabajo('w1')
+
+    aplicacion.liberar_trabajos_colgados()
+    assert recargar(trabajo_id).estado == 'en_proceso'
+
+    pendiente = recargar(trabajo_id)
+    pendiente.fecha_inicio = datetime.utcnow() - timedelta(seconds=app.config['TRABAJOS_DURACION_MAX'] + 1)
+    pendiente.latido = datetime.utcnow()
+    db.session.commit()
+    aplicacion.liberar_trabajos_colgados()
+    assert recargar(trabajo_id).estado == 'pendiente'
+
+
+def test_worker_una_vez_termina_ante_error_de_base(contexto, monkeypatch):
+    def base_bloqueada(nombre_worker):
+        raise RuntimeError('database is locked')
+    monkeypatch.setattr(aplicacion, 'reclamar_trabajo', base_bloqueada)
+    monkeypatch.setattr(aplicacion, 'PROGRAMACIONES', [])
+
+    aplicacion.ejecutar_worker(0, una_vez=True)